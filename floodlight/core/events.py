@@ -497,15 +497,21 @@ class Events:
         start = int(np.round(np.nanmin(sorted_events["frameclock"].values)))
         end = int(np.round(np.nanmax(sorted_events["frameclock"].values))) + 1
 
+        # skip events without frameclock
+        frameclock = sorted_events["frameclock"].values.astype(float)
+        is_valid = ~np.isnan(frameclock)
+        frames = np.round(frameclock[is_valid]).astype(int) - start
+        eIDs = sorted_events["eID"].values[is_valid]
+
+        # each frame holds the latest preceding event (if still within its fade)
+        frame_range = np.arange(end - start)
+        latest = np.searchsorted(frames, frame_range, side="right") - 1
+        is_filled = latest >= 0
+        if fade is not None:
+            is_filled &= frame_range - frames[latest] <= fade
+
         code = np.full((end - start,), np.nan, dtype=object)
-        for _, event in sorted_events.iterrows():
-            if pd.isna(event["frameclock"]):
-                continue
-            frame = int(np.round(event["frameclock"]))
-            if fade is None:
-                code[frame - start :] = event["eID"]
-            else:
-                code[frame - start : frame - start + fade + 1] = event["eID"]
+        code[is_filled] = eIDs[latest[is_filled]]
 
         event_stream = Code(
             code=code,
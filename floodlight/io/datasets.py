@@ -198,6 +198,11 @@ class ToyDataset:
             "HT1": {"Home": "rl", "Away": "lr"},
             "HT2": {"Home": "lr", "Away": "rl"},
         }
+        self._TOY_EVENTS_DTYPES = {
+            "eID": str,
+            "gameclock": np.float64,
+            "outcome": np.float64,
+        }
         self._data_dir = os.path.join(DATA_DIR, "toy_dataset")
 
     def get(
@@ -242,13 +247,15 @@ class ToyDataset:
 
         events_home = Events(
             events=pd.read_csv(
-                os.path.join(self._data_dir, f"events_home_{segment.lower()}.csv")
+                os.path.join(self._data_dir, f"events_home_{segment.lower()}.csv"),
+                dtype=self._TOY_EVENTS_DTYPES,
             )
         )
 
         events_away = Events(
             events=pd.read_csv(
-                os.path.join(self._data_dir, f"events_away_{segment.lower()}.csv")
+                os.path.join(self._data_dir, f"events_away_{segment.lower()}.csv"),
+                dtype=self._TOY_EVENTS_DTYPES,
             )
         )
 
@@ -449,7 +456,7 @@ class StatsBombOpenDataset:
             ``sex`` of the players (female or male), the ``StatsBomb360_status``  and
             the final ``score``.
         """
-        summary = pd.DataFrame()
+        match_infos = []
 
         # loop over season and competition
         for competition in self._links_competition_to_cID:
@@ -485,7 +492,11 @@ class StatsBombOpenDataset:
                         "sID": sID,
                         "mID": info["match_id"],
                     }
-                    summary = summary.append(match_info, ignore_index=True)
+                    match_infos.append(match_info)
+
+        # assembly
+        summary = pd.DataFrame(match_infos)
+
         return summary
 
     def get(
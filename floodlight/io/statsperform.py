@@ -1,13 +1,15 @@
+import csv
+import io
 import os.path
 import warnings
-from typing import Dict, Tuple, Union
+from typing import IO, Dict, Tuple, Union
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 from lxml import etree
 
-from floodlight.io.utils import download_from_url, get_and_convert
+from floodlight.io.utils import download_from_url, download_to_file, get_and_convert
 from floodlight.core.code import Code
 from floodlight.core.events import Events
 from floodlight.core.pitch import Pitch
@@ -16,6 +18,9 @@ from floodlight.settings import DATA_DIR
 
 # ----------------------------- StatsPerform Open Format -------------------------------
 
+# number of rows of the open csv files that are parsed at once
+_OPEN_CSV_CHUNKSIZE = 2_000_000
+
 
 def _create_metadata_from_open_csv_df(
     csv_df: pd.DataFrame,
@@ -49,11 +54,12 @@ def _create_metadata_from_open_csv_df(
 
     # create periods for segments, coded as jumps in the frame sequence
     periods = {}
-    frame_values = csv_df["frame_count"].unique()
+    frame_values = csv_df["frame_count"].to_numpy()
+    # frames are sorted, so dropping consecutive duplicates yields unique frames
+    frame_values = frame_values[np.r_[True, frame_values[1:] != frame_values[:-1]]]
 
-    seg_idx = np.where(np.diff(frame_values, prepend=frame_values[0]) > 1)
-    seg_idx = np.insert(seg_idx, 0, 0)
-    seg_idx = np.append(seg_idx, len(frame_values))
+    seg_idx = np.flatnonzero(np.diff(frame_values) > 1) + 1
+    seg_idx = np.r_[0, seg_idx, len(frame_values)]
     for segment in range(len(seg_idx) - 1):
         start = int(frame_values[seg_idx[segment]])
         end = int(frame_values[seg_idx[segment + 1] - 1])
@@ -80,81 +86,20 @@ def _create_links_from_open_csv_df(
     links: Dict[str, Dict[int, int]]
         A link dictionary of the form ``links[team][jID] = xID``.
     """
+    # unique jIDs per team in order of appearance
+    jerseys = csv_df.drop_duplicates(["team_id", "jersey_no"])
+
     links = {}
     for team in team_ids:
         links[team] = {
             int(jID): xID
             for xID, jID in enumerate(
-                csv_df[csv_df["team_id"] == team_ids[team]]["jersey_no"].unique()
+                jerseys.loc[jerseys["team_id"] == team_ids[team], "jersey_no"]
             )
         }
     return links
 
 
-def _read_open_event_csv_single_line(
-    line: str,
-) -> Tuple[Dict, str, str]:
-    """Extracts all relevant information from a single line of StatsPerform's Event csv
-    file (i.e. one single event in the data).
-
-    Parameters
-    ----------
-    line: str
-        One full line from StatsPerform's Event csv file.
-
-    Returns
-    -------
-    event: Dict
-        Dictionary with relevant event information in the form:
-        ``event[attribute] = value``.
-    """
-    event = {}
-    attrib = line.split(sep=",")
-
-    # description
-    event["eID"] = attrib[5].replace(" ", "")
-
-    # relative time
-    event["gameclock"] = float(attrib[4])
-    event["frameclock"] = float(attrib[2])
-
-    # segment, player and team
-    segment = attrib[3]
-    team = attrib[9]
-    event["tID"] = team
-    event["pID"] = attrib[8]
-
-    # outcome
-    event["outcome"] = np.nan
-    if "Won" in attrib[5].split(" "):
-        event["outcome"] = 1
-    elif "Lost" in attrib[5].split(" "):
-        event["outcome"] = 0
-
-    # minute and second of game
-    event["minute"] = np.floor(event["gameclock"] / 60)
-    event["second"] = np.floor(event["gameclock"] - event["minute"] * 60)
-
-    # additional information (qualifier)
-    event["qualifier"] = {
-        "event_id": attrib[1],
-        "event_type_id": attrib[6],
-        "sequencenumber": attrib[7],
-        "jersey_no": attrib[10],
-        "is_pass": attrib[11],
-        "is_cross": attrib[12],
-        "is_corner": attrib[13],
-        "is_free_kick": attrib[14],
-        "is_goal_kick": attrib[15],
-        "passtypeid": attrib[16],
-        "wintypeid": attrib[17],
-        "savetypeid": attrib[18],
-        "possessionnumber": attrib[19],
-    }
-
-    return event, team, segment
-
-
 def create_links_from_open_tracking_data_csv(
     filepath_tracking: Union[str, Path]
 ) -> Dict[str, Dict[int, int]]:
@@ -171,8 +116,8 @@ def create_links_from_open_tracking_data_csv(
     links: Dict[str, Dict[int, int]]
         A link dictionary of the form ``links[team][jID] = xID``.
     """
-    # read dat-file into pd.DataFrame
-    dat_df = pd.read_csv(str(filepath_tracking))
+    # read dat-file into pd.DataFrame, links only require team and jersey numbers
+    dat_df = pd.read_csv(str(filepath_tracking), usecols=["team_id", "jersey_no"])
 
     # initialize team and ball ids
     team_ids = {"Home": 1.0, "Away": 2.0}
@@ -212,39 +157,86 @@ def read_open_event_data_csv(
     are parsed as a string in the ``qualifier`` column of the returned DataFrame and can
     be transformed to a dict of form ``{attribute: value}``.
     """
-    # initialize bin and variables
-    events = {}
-    teams = ["1.0", "2.0"]
-    segments = ["1", "2"]
-    for team in teams:
-        events[team] = {segment: pd.DataFrame() for segment in segments}
+    # parse the csv file into pd.DataFrame with columns addressed by position
+    events_df = pd.read_csv(
+        str(filepath_events), usecols=range(20), dtype=str, keep_default_na=False
+    )
+    events_df.columns = range(20)
 
-    # parse event data
-    with open(str(filepath_events), "r") as f:
-        while True:
-            line = f.readline()
+    # description
+    event_names = events_df[5]
+    events_df["eID"] = event_names.str.replace(" ", "", regex=False)
 
-            # terminate if at end of file
-            if len(line) == 0:
-                break
+    # relative time
+    events_df["gameclock"] = events_df[4].astype(float)
+    events_df["frameclock"] = events_df[2].astype(float)
 
-            # skip the head
-            if line.split(sep=",")[3] == "current_phase":
-                continue
+    # player and team
+    events_df["tID"] = events_df[9]
+    events_df["pID"] = events_df[8]
 
-            # read single line
-            event, team, segment = _read_open_event_csv_single_line(line)
+    # outcome
+    events_df["outcome"] = np.where(
+        event_names.str.contains(r"(?:^| )Won(?: |$)"),
+        1,
+        np.where(event_names.str.contains(r"(?:^| )Lost(?: |$)"), 0, np.nan),
+    )
 
-            # insert to bin
-            if team:
-                events[team][segment] = events[team][segment].append(
-                    event, ignore_index=True
-                )
-            else:  # if no clear assignment possible, insert to bins for both teams
-                for team in teams:
-                    events[team][segment] = events[team][segment].append(
-                        event, ignore_index=True
-                    )
+    # minute and second of game
+    minute, second = np.divmod(events_df["gameclock"], 60)
+    events_df["minute"] = minute
+    events_df["second"] = np.floor(second)
+
+    # additional information (qualifier)
+    qualifier_columns = {
+        1: "event_id",
+        6: "event_type_id",
+        7: "sequencenumber",
+        10: "jersey_no",
+        11: "is_pass",
+        12: "is_cross",
+        13: "is_corner",
+        14: "is_free_kick",
+        15: "is_goal_kick",
+        16: "passtypeid",
+        17: "wintypeid",
+        18: "savetypeid",
+        19: "possessionnumber",
+    }
+    events_df["qualifier"] = (
+        events_df[list(qualifier_columns)]
+        .rename(columns=qualifier_columns)
+        .to_dict(orient="records")
+    )
+
+    # split into bins, events without clear team assignment are inserted to both
+    columns = [
+        "eID",
+        "gameclock",
+        "frameclock",
+        "tID",
+        "pID",
+        "outcome",
+        "minute",
+        "second",
+        "qualifier",
+    ]
+    teams = ["1.0", "2.0"]
+    segments = ["1", "2"]
+    unknown_teams = set(events_df[9]) - set(teams) - {""}
+    unknown_segments = set(events_df[3]) - set(segments)
+    if unknown_teams or unknown_segments:
+        raise KeyError(
+            f"Expected team ids {teams} and segments {segments}, found unknown team "
+            f"id(s) {unknown_teams or None} and segment(s) {unknown_segments or None}!"
+        )
+    no_team = events_df[9] == ""
+    events = {}
+    for team in teams:
+        events[team] = {}
+        for segment in segments:
+            mask = ((events_df[9] == team) | no_team) & (events_df[3] == segment)
+            events[team][segment] = events_df.loc[mask, columns].reset_index(drop=True)
 
     # assembly
     t1_ht1 = Events(
@@ -274,7 +266,9 @@ def read_open_tracking_data_csv(
      Openly published StatsPerform position data (e.g. for the Pro Forum '22) is stored
      in a csv file containing all position data (for both halves) as well as information
      about players, the pitch, and the ball possession. This function provides a
-     high-level access to StatsPerform data by parsing the csv file.
+     high-level access to StatsPerform data by parsing the csv file. The file is read
+     in two passes over chunks of rows, the first one gathering frames, jerseys and
+     pitch information and the second one inserting positions and possession codes.
 
     Parameters
     ----------
@@ -285,7 +279,7 @@ def read_open_tracking_data_csv(
         identified in StatsPerform files via jID, and this dictionary is used to map
         them to a specific xID in the respective XY objects. Should be supplied if that
         order matters. If None is given (default), the links are automatically extracted
-        from the csv file at the cost of a second pass through the entire file.
+        from the jerseys gathered in the first pass through the csv file.
 
     Returns
     -------
@@ -294,27 +288,57 @@ def read_open_tracking_data_csv(
         (home_ht1, home_ht2, away_ht1, away_ht2, ball_ht1, ball_ht2,
         possession_ht1, possession_ht2, pitch)
     """
-    # parse the csv file into pd.DataFrame
-    dat_df = pd.read_csv(str(filepath_tracking))
+    # required columns of the csv file
+    dtypes = {
+        "team_id": np.float64,
+        "jersey_no": np.float64,
+        "frame_count": np.int64,
+        "pos_x": np.float64,
+        "pos_y": np.float64,
+        "possession": np.float64,
+        "pitch_dimension_long_side": np.float64,
+        "pitch_dimension_short_side": np.float64,
+    }
+    meta_columns = [
+        "team_id",
+        "jersey_no",
+        "frame_count",
+        "pitch_dimension_long_side",
+        "pitch_dimension_short_side",
+    ]
+
+    # first pass: reduce chunks of the csv file to unique frames and jerseys
+    frames_chunks = []
+    jerseys_chunks = []
+    for chunk in pd.read_csv(
+        str(filepath_tracking),
+        usecols=meta_columns,
+        dtype={col: dtypes[col] for col in meta_columns},
+        chunksize=_OPEN_CSV_CHUNKSIZE,
+    ):
+        frames_chunks.append(chunk.drop_duplicates(["frame_count"]))
+        jerseys_chunks.append(chunk.drop_duplicates(["team_id", "jersey_no"]))
+    frames_df = pd.concat(frames_chunks, ignore_index=True)
+    jerseys_df = pd.concat(jerseys_chunks, ignore_index=True)
 
     # initialize team and ball ids
     team_ids = {"Home": 1.0, "Away": 2.0}
     ball_id = 4
 
     # check for additional tIDs
-    for ID in dat_df["team_id"].unique():
+    for ID in jerseys_df["team_id"].unique():
         if not (ID in team_ids.values() or ID == ball_id):
             warnings.warn(f"Team ID {ID} did not match any of the standard IDs!")
 
     # create or check links
     if links is None:
-        links = _create_links_from_open_csv_df(dat_df, team_ids)
+        links = _create_links_from_open_csv_df(jerseys_df, team_ids)
     else:
         pass
         # potential check vs jerseys in dat file
 
     # create periods and pitch
-    periods, pitch = _create_metadata_from_open_csv_df(dat_df)
+    periods, pitch = _create_metadata_from_open_csv_df(frames_df)
     segments = list(periods.keys())
 
     # infer data shapes
@@ -326,7 +350,11 @@ def read_open_tracking_data_csv(
         number_of_frames[segment] = end - start + 1
 
     # bins
-    codes = {"possession": {segment: [] for segment in segments}}
+    codes = {
+        "possession": {
+            segment: np.full(number_of_frames[segment], np.nan) for segment in segments
+        }
+    }
     xydata = {
         "Home": {
             segment: np.full(
@@ -335,6 +363,7 @@ def read_open_tracking_data_csv(
                     number_of_players[list(links.keys())[0]] * 2,
                 ],
                 np.nan,
+                order="F",
             )
             for segment in periods
         },
@@ -345,59 +374,70 @@ def read_open_tracking_data_csv(
                     number_of_players[list(links.keys())[1]] * 2,
                 ],
                 np.nan,
+                order="F",
             )
             for segment in periods
         },
         "Ball": {
-            segment: np.full([number_of_frames[segment], 2], np.nan)
+            segment: np.full([number_of_frames[segment], 2], np.nan, order="F")
             for segment in periods
         },
     }
 
-    # loop
-    for segment in segments:
+    # lookup arrays mapping jIDs to xIDs, jIDs without link are marked by -1 (sized to
+    # cover jIDs from both the links and the data)
+    xIDs_of_jIDs = {}
+    for team in team_ids:
+        team_jIDs = jerseys_df.loc[jerseys_df["team_id"] == team_ids[team], "jersey_no"]
+        max_jID = max([*links[team], *team_jIDs.astype(int)], default=0)
+        xIDs_of_jIDs[team] = np.full(max_jID + 1, -1)
+        for jID, xID in links[team].items():
+            xIDs_of_jIDs[team][jID] = xID
+
+    # second pass: insert chunks of the csv file into bins
+    for dat_df in pd.read_csv(
+        str(filepath_tracking),
+        usecols=list(dtypes),
+        dtype=dtypes,
+        chunksize=_OPEN_CSV_CHUNKSIZE,
+    ):
+        frames = dat_df["frame_count"].values
+        team_id_values = dat_df["team_id"].values
+
+        for segment in segments:
+
+            # rows of segment
+            start, end = periods[segment]
+            in_segment = np.logical_and(frames >= start, frames <= end)
+
+            # teams
+            for team in team_ids:
+                team_df = dat_df[in_segment & (team_id_values == team_ids[team])]
+
+                # map jersey numbers to array columns
+                jIDs = team_df["jersey_no"].values.astype(int)
+                xIDs = xIDs_of_jIDs[team][jIDs]
+                if np.any(xIDs == -1):
+                    raise KeyError(
+                        f"Jersey number(s) {set(jIDs[xIDs == -1])} of team {team} "
+                        f"are missing in links!"
+                    )
+                x_cols = (xIDs - 1) * 2
+                y_cols = (xIDs - 1) * 2 + 1
 
-        # teams
-        for team in team_ids:
-            team_df = dat_df[dat_df["team_id"] == team_ids[team]]
-            for pID in team_df["player_id"].unique():
-                # extract player information
-                pl_df = team_df[team_df["player_id"] == pID]
-                frames = pl_df["frame_count"].values
-                x_position = pl_df["pos_x"].values
-                y_position = pl_df["pos_y"].values
-
-                # compute appearance of player in segment
-                appearance = np.array(
-                    [
-                        (periods[segment][0] <= frame <= periods[segment][-1])
-                        for frame in frames
-                    ]
-                )
-                # check for players that did not play in segment
-                if not np.sum(appearance):
-                    continue
+                # insert player positions to bin array
+                rows = team_df["frame_count"].values - start
+                xydata[team][segment][rows, x_cols] = team_df["pos_x"].values
+                xydata[team][segment][rows, y_cols] = team_df["pos_y"].values
 
-                # insert player position to bin array
-                jrsy = int(pl_df["jersey_no"].values[0])
-                x_col = (links[team][jrsy] - 1) * 2
-                y_col = (links[team][jrsy] - 1) * 2 + 1
-                start = frames[appearance][0] - periods[segment][0]
-                end = frames[appearance][-1] - periods[segment][0] + 1
-                xydata[team][segment][start:end, x_col] = x_position[appearance]
-                xydata[team][segment][start:end, y_col] = y_position[appearance]
-
-        # ball
-        ball_df = dat_df[dat_df["team_id"] == 4]
-        frames = ball_df["frame_count"].values
-        appearance = np.array(
-            [(periods[segment][0] <= frame <= periods[segment][-1]) for frame in frames]
-        )
-        xydata["Ball"][segment][:, 0] = ball_df["pos_x"].values[appearance]
-        xydata["Ball"][segment][:, 1] = ball_df["pos_x"].values[appearance]
+            # ball
+            ball_df = dat_df[in_segment & (team_id_values == ball_id)]
+            rows = ball_df["frame_count"].values - start
+            xydata["Ball"][segment][rows, 0] = ball_df["pos_x"].values
+            xydata["Ball"][segment][rows, 1] = ball_df["pos_y"].values
 
-        # update codes
-        codes["possession"][segment] = ball_df["possession"].values[appearance]
+            # update codes
+            codes["possession"][segment][rows] = ball_df["possession"].values
 
     # create XY objects
     home_ht1 = XY(xy=xydata["Home"][0], framerate=10)
@@ -437,98 +477,17 @@ def read_open_tracking_data_csv(
 
 # ----------------------------- StatsPerform Format ---------------------------
 
+# number of lines (frames) of the txt files that are parsed at once
+_TXT_CHUNKSIZE = 100_000
 
-def _read_tracking_data_txt_single_line(
-    line: str,
-) -> Tuple[
-    int,
-    int,
-    Dict[str, Dict[str, Tuple[float, float, float]]],
-    Dict[str, Union[str, tuple]],
-]:
-    """Extracts all relevant information from a single line of StatsPerform's tracking
-    data .txt file (i.e. one frame of data).
-
-    Parameters
-    ----------
-    line: str
-        One full line from StatsPerform's .txt-file, equals one sample of data.
 
-    Returns
-    -------
-    gameclock: int
-        The gameclock of the current segment in milliseconds.
-    segment: int
-        The segment identifier.
-    positions: Dict[str, Dict[str, Tuple[float, float, float]]]
-        Nested dictionary that stores player position information for each team and
-        player. Has the form ``positions[team][jID] = (x, y)``.
-    ball: Dict[str]
-        Dictionary with ball information. Has keys 'position', 'possession' and
-        'ballstatus'.
-    """
-    # bins
-    positions = {"Home": {}, "Away": {}, "Other": {}}
-    ball = {}
-
-    # read chunks
-    chunks = line.split(":")
-    time_chunk = chunks[0]
-    player_chunks = chunks[1].split(";")
-
-    ball_chunk = None
-    if len(chunks) > 2:  # check if ball information exist in chunk
-        ball_chunk = chunks[2]
-
-    # time chunk
-    # systemclock = time_chunk.split(";")[0]
-    # possible check or synchronization step
-    timeinfo = time_chunk.split(";")[1].split(",")
-    gameclock = int(timeinfo[0])
-    segment = int(timeinfo[1])
-    # ballstatus = timeinfo[2].split(":")[0] == '0'  # '0' seems to be always the case?
-
-    # player chunks
-    for player_chunk in player_chunks:
-
-        # skip final entry of chunk
-        if not player_chunk or player_chunk == "\n":
-            continue
-
-        # read team
-        chunk_data = player_chunk.split(",")
-        if chunk_data[0] in ["0", "3"]:
-            team = "Home"
-        elif chunk_data[0] in ["1", "4"]:
-            team = "Away"
-        else:
-            team = "Other"
-
-        # read IDs
-        # pID = chunk_data[1]
-        jID = chunk_data[2]
-
-        # read positions
-        x, y = map(lambda x: float(x), chunk_data[3:])
-
-        # assign
-        positions[team][jID] = (x, y)
-
-    # ball chunk
-    if ball_chunk is not None:
-        x, y, z = map(lambda x: float(x), ball_chunk.split(";")[0].split(","))
-        # ball["position"] = (x, y, z)  # z-coordinate is not yet supported
-        ball["position"] = (x, y)
-
-    return gameclock, segment, positions, ball
-
-
-def _read_time_information_from_tracking_data_txt(
+def _read_meta_information_from_tracking_data_txt(
     filepath_txt: Union[str, Path],
-) -> Tuple[Dict, Union[int, None]]:
-    """Reads StatsPerform's tracking .txt file and extracts information about the first
-    and last frame of periods. Also, a framerate is estimated from the
-    gameclock difference between samples.
+) -> Tuple[Dict, Union[int, None], set, set]:
+    """Reads StatsPerform's tracking .txt file in a single pass and extracts information
+    about the first and last frame of periods as well as unique sets of jIDs
+    (jerseynumbers) for both teams. Also, a framerate is estimated from the gameclock
+    difference between samples. Positions are not parsed.
 
     Parameters
     ----------
@@ -542,49 +501,66 @@ def _read_time_information_from_tracking_data_txt(
         ``periods[segment] = [startframe, endframe]``.
     framerate_est: int or None
         Estimated temporal resolution of data in frames per second/Hertz.
+    home_jIDs: set
+    away_jIDs: set
     """
 
     # bins
     startframes = {}
     endframes = {}
     framerate_est = None
-
-    # read txt file from disk
-    file_txt = open(filepath_txt, "r")
+    home_jIDs = set()
+    away_jIDs = set()
 
     # loop
     last_gameclock = None
     last_segment = None
-    for line in file_txt.readlines():
+    with open(filepath_txt, "rb", buffering=1 << 20) as file_txt:
+        for line in file_txt:
+            chunks = line.split(b":", 2)
+
+            # read gameclock and segment
+            timeinfo = chunks[0].split(b";", 1)[1].split(b",", 2)
+            gameclock = int(timeinfo[0])
+            segment = int(timeinfo[1])
+
+            # extract jersey numbers
+            for player_chunk in chunks[1].split(b";"):
+                # skip final entry of chunk
+                if not player_chunk or player_chunk.isspace():
+                    continue
 
-        # read gameclock and segment
-        gameclock, segment, _, _ = _read_tracking_data_txt_single_line(line)
+                chunk_data = player_chunk.split(b",", 3)
+                if chunk_data[0] in [b"0", b"3"]:
+                    home_jIDs.add(chunk_data[2].decode())
+                elif chunk_data[0] in [b"1", b"4"]:
+                    away_jIDs.add(chunk_data[2].decode())
 
-        # update periods
-        if segment not in startframes:
-            startframes[segment] = gameclock
+            # update periods
+            if segment not in startframes:
+                startframes[segment] = gameclock
+                if last_gameclock is not None:
+                    endframes[last_segment] = last_gameclock
+
+            # estimate framerate if desired
             if last_gameclock is not None:
-                endframes[last_segment] = last_gameclock
-
-        # estimate framerate if desired
-        if last_gameclock is not None:
-            delta = np.absolute(gameclock - last_gameclock)  # in milliseconds
-            if framerate_est is None:
-                framerate_est = int(1000 / delta)
-            elif framerate_est != int(1000 / delta) and last_segment == segment:
-                warnings.warn(
-                    f"Framerate estimation yielded diverging results."
-                    f"The originally estimated framerate of {framerate_est} Hz did not "
-                    f"match the current estimation of {int(1000 / delta)} Hz. This "
-                    f"might be caused by missing frame(s) in the position data. "
-                    f"Continuing by choosing the latest estimation of "
-                    f"{int(1000 / delta)} Hz"
-                )
-                framerate_est = int(1000 / delta)
+                delta = np.absolute(gameclock - last_gameclock)  # in milliseconds
+                if framerate_est is None:
+                    framerate_est = int(1000 / delta)
+                elif framerate_est != int(1000 / delta) and last_segment == segment:
+                    warnings.warn(
+                        f"Framerate estimation yielded diverging results."
+                        f"The originally estimated framerate of {framerate_est} Hz did "
+                        f"not match the current estimation of {int(1000 / delta)} Hz. "
+                        f"This might be caused by missing frame(s) in the position "
+                        f"data. Continuing by choosing the latest estimation of "
+                        f"{int(1000 / delta)} Hz"
+                    )
+                    framerate_est = int(1000 / delta)
 
-        # update variables
-        last_gameclock = gameclock
-        last_segment = segment
+            # update variables
+            last_gameclock = gameclock
+            last_segment = segment
 
     # update end of final segment
     endframes[last_segment] = last_gameclock
@@ -594,50 +570,37 @@ def _read_time_information_from_tracking_data_txt(
         segment: (startframes[segment], endframes[segment]) for segment in startframes
     }
 
-    # close file
-    file_txt.close()
+    return periods, framerate_est, home_jIDs, away_jIDs
 
-    return periods, framerate_est
 
-
-def _read_jersey_numbers_from_tracking_data_txt(
-    file_location_txt: Union[str, Path],
-) -> Tuple[set, set]:
-    """Reads StatsPerform's tracking .txt file and extracts unique set of jIDs
-    (jerseynumbers) for both teams.
+def _create_links_from_jIDs(
+    home_jIDs: set,
+    away_jIDs: set,
+) -> Dict[str, Dict[str, int]]:
+    """Creates a dictionary linking jIDs (jerseynumbers) to xIDs in ascending order.
 
     Parameters
     ----------
-    file_location_txt: str or pathlib.Path
-        Full path to the txt file containing the tracking data.
+    home_jIDs: set
+    away_jIDs: set
 
     Returns
     -------
-    home_jIDs: set
-    away_jIDs: set
+    links: Dict[str, Dict[str, int]]
+        Link-dictionary of the form ``links[team][jID] = xID``.
     """
+    homejrsy = list(home_jIDs)
+    awayjrsy = list(away_jIDs)
 
-    # bins
-    home_jIDs = set()
-    away_jIDs = set()
-
-    # read txt file from disk
-    file_txt = open(file_location_txt, "r")
-
-    # loop
-    for package in file_txt.readlines():
-
-        # read line
-        _, _, positions, _ = _read_tracking_data_txt_single_line(package)
-
-        # extract jersey numbers
-        home_jIDs |= set(positions["Home"].keys())
-        away_jIDs |= set(positions["Away"].keys())
+    homejrsy.sort()
+    awayjrsy.sort()
 
-    # close file
-    file_txt.close()
+    links = {
+        "Home": {jID: xID for xID, jID in enumerate(homejrsy)},
+        "Away": {jID: xID for xID, jID in enumerate(awayjrsy)},
+    }
 
-    return home_jIDs, away_jIDs
+    return links
 
 
 def create_links_from_statsperform_tracking_data_txt(
@@ -656,46 +619,26 @@ def create_links_from_statsperform_tracking_data_txt(
     links: Dict[str, Dict[int, int]]
         Link-dictionary of the form ``links[team][jID] = xID``.
     """
-    homejrsy, awayjrsy = _read_jersey_numbers_from_tracking_data_txt(filepath_txt)
-
-    homejrsy = list(homejrsy)
-    awayjrsy = list(awayjrsy)
-
-    homejrsy.sort()
-    awayjrsy.sort()
-
-    links = {
-        "Home": {jID: xID for xID, jID in enumerate(homejrsy)},
-        "Away": {jID: xID for xID, jID in enumerate(awayjrsy)},
-    }
+    _, _, homejrsy, awayjrsy = _read_meta_information_from_tracking_data_txt(
+        filepath_txt
+    )
 
-    return links
+    return _create_links_from_jIDs(homejrsy, awayjrsy)
 
 
-def read_event_data_xml(
-    filepath_xml: Union[str, Path],
-) -> Tuple[Events, Events, Events, Events, Pitch]:
-    """Parses a StatsPerform .xml file and extracts event data and pitch information.
-
-    This function provides a high-level access to the StatsPerform match events xml file
-    and returns Events objects for both teams and information about the pitch.
+class _EventDataXMLTarget:
+    """Parser target for lxml that extracts links and events from StatsPerform's event
+    data .xml file on the fly via the parser's callbacks, i.e. without building element
+    objects or a tree.
 
-    Parameters
+    Attributes
     ----------
-    filepath_xml: str or pathlib.Path
-        Full path to the xml file containing the event data.
-
-    Returns
-    -------
-    data_objects: Tuple[Events, Events, Events, Events, Pitch]
-        Events-objects for both teams and both halves and pitch information. The order
-        is (home_ht1, home_ht2, away_ht1, away_ht2, pitch).
+    event_lists: Dict[str, Dict[str, Dict[str, list]]]
+        Bins of the form ``event_lists[team][segment][column] = values``.
+    root_attrib: dict
+        Attributes of the root element, containing pitch information.
     """
-    # load xml tree into memory
-    tree = etree.parse(str(filepath_xml))
-    root = tree.getroot()
 
-    # create bins, read segments, and assign teams
     columns = [
         "eID",
         "gameclock",
@@ -709,97 +652,154 @@ def read_event_data_xml(
         "to_y",
         "qualifier",
     ]
-    segments = [
-        f"HT{get_and_convert(period.attrib, 'IdHalf', str)}"
-        for period in root.findall("Events/EventsHalf")
-    ]
     teams = ["Home", "Away"]
 
-    # bins
-    event_lists = {
-        team: {segment: {col: [] for col in columns} for segment in segments}
-        for team in teams
-    }
-
-    # create links
-    links_pID_to_tID = {}
-    links_pID_to_jID = {}
-    links_pID_to_name = {}
-    for teamsheet in root.findall("MatchSheet/Team"):
-        # skip referees
-        if teamsheet.attrib["Type"] == "Referees":
-            continue
-        # read team
-        team = teamsheet.attrib["Type"][:-4]  # cut 'Team' of e.g. 'HomeTeam'
-        # assign player ids to team
-        for actor in teamsheet.findall("Actor"):
-            if actor.attrib["Occupation"] != "Player":  # coaches etc.
-                continue
-            links_pID_to_tID[get_and_convert(actor, "IdActor", int)] = team
-            links_pID_to_jID[get_and_convert(actor, "IdActor", int)] = get_and_convert(
-                actor, "JerseyNumber", int
-            )
-            links_pID_to_name[get_and_convert(actor, "IdActor", int)] = get_and_convert(
-                actor, "NickName", str
+    def __init__(self):
+        # bins
+        self.event_lists = {team: {} for team in self.teams}
+        self.root_attrib = None
+
+        # links
+        self.links_pID_to_tID = {}
+        self.links_pID_to_jID = {}
+        self.links_pID_to_name = {}
+
+        # parser state, events are collected per segment and only assigned to teams
+        # once the parser is closed as teamsheets may follow the events in the file
+        self._open_tags = []
+        self._teamsheet = None
+        self._segment_events = {}
+        self._current_events = None
+
+    def start(self, tag, attrib):
+        parent_tag = self._open_tags[-1] if self._open_tags else None
+        self._open_tags.append(tag)
+
+        # pitch information
+        if parent_tag is None:
+            self.root_attrib = dict(attrib)
+
+        # read team of teamsheet (skip referees)
+        elif tag == "Team" and parent_tag == "MatchSheet":
+            if attrib["Type"] != "Referees":
+                self._teamsheet = attrib["Type"][:-4]  # cut 'Team' of e.g. 'HomeTeam'
+
+        # create links
+        elif tag == "Actor" and parent_tag == "Team" and self._teamsheet is not None:
+            if attrib["Occupation"] == "Player":  # skip coaches etc.
+                pID = get_and_convert(attrib, "IdActor", int)
+                self.links_pID_to_tID[pID] = self._teamsheet
+                self.links_pID_to_jID[pID] = get_and_convert(
+                    attrib, "JerseyNumber", int
+                )
+                self.links_pID_to_name[pID] = get_and_convert(attrib, "NickName", str)
+
+        # get segment information once a half starts
+        elif tag == "EventsHalf" and parent_tag == "Events":
+            period = get_and_convert(attrib, "IdHalf", str)
+            segment = "HT" + str(period)
+            # halves with the same IdHalf are collected into the same bins
+            self._current_events = self._segment_events.setdefault(
+                segment,
+                {
+                    col: []
+                    for col in self.columns
+                    if col not in ["jID", "minute", "second"]
+                },
             )
 
-    # loop over events
-    for half in root.findall("Events/EventsHalf"):
-        # get segment information
-        period = get_and_convert(half.attrib, "IdHalf", str)
-        segment = "HT" + str(period)
-        for event in half.findall("Event"):
-            # read pID
-            pID = get_and_convert(event.attrib, "IdActor1", int)
-
-            # assign team
-            team = get_and_convert(links_pID_to_tID, pID, str)
-
-            # create list of either a single team or both teams if no clear assignment
-            if team == "None":
-                teams_assigned = teams  # add to both teams
-            else:
-                teams_assigned = [team]  # only add to one team
-
-            # identifier
-            eID = get_and_convert(event.attrib, "EventName", str)
-            jID = get_and_convert(links_pID_to_jID, pID, int)
-            for team in teams_assigned:
-                event_lists[team][segment]["eID"].append(eID)
-                event_lists[team][segment]["pID"].append(pID)
-                event_lists[team][segment]["jID"].append(jID)
-
-            # relative time
-            gameclock = get_and_convert(event.attrib, "Time", int) / 1000
-            minute = np.floor(gameclock / 60)
-            second = np.floor(gameclock - minute * 60)
-            for team in teams_assigned:
-                event_lists[team][segment]["gameclock"].append(gameclock)
-                event_lists[team][segment]["minute"].append(minute)
-                event_lists[team][segment]["second"].append(second)
-
-            # location
-            at_x = get_and_convert(event.attrib, "LocationX", float)
-            at_y = get_and_convert(event.attrib, "LocationY", float)
-            to_x = get_and_convert(event.attrib, "TargetX", float)
-            to_y = get_and_convert(event.attrib, "TargetY", float)
-            for team in teams_assigned:
-                event_lists[team][segment]["at_x"].append(at_x)
-                event_lists[team][segment]["at_y"].append(at_y)
-                event_lists[team][segment]["to_x"].append(to_x)
-                event_lists[team][segment]["to_y"].append(to_y)
-
-            # qualifier
-            qual_dict = {}
-            for qual_id in event.attrib:
-                qual_value = event.attrib.get(qual_id)
-                qual_dict[qual_id] = qual_value
-            for team in teams_assigned:
-                event_lists[team][segment]["qualifier"].append(str(qual_dict))
+        # read single event
+        elif tag == "Event" and parent_tag == "EventsHalf":
+            self._read_event(attrib)
+
+    def end(self, tag):
+        self._open_tags.pop()
+        if tag == "Team":
+            self._teamsheet = None
+
+    def close(self):
+        # assign events to teams now that all links are known
+        for segment, segment_events in self._segment_events.items():
+            pIDs = segment_events["pID"]
+            event_teams = [str(self.links_pID_to_tID.get(pID)) for pID in pIDs]
+            segment_events["jID"] = [self.links_pID_to_jID.get(pID) for pID in pIDs]
+            for team in self.teams:
+                # events without clear team assignment are added to both teams
+                idx = [i for i, tm in enumerate(event_teams) if tm in [team, "None"]]
+                self.event_lists[team][segment] = {
+                    col: (
+                        [segment_events[col][i] for i in idx]
+                        if col in segment_events
+                        else []
+                    )
+                    for col in self.columns
+                }
+
+        return self
+
+    def _read_event(self, attrib):
+        events = self._current_events
+
+        # identifier
+        events["eID"].append(str(attrib.get("EventName")))
+        events["pID"].append(get_and_convert(attrib, "IdActor1", int))
+
+        # relative time
+        events["gameclock"].append(get_and_convert(attrib, "Time", int) / 1000)
+
+        # location
+        events["at_x"].append(get_and_convert(attrib, "LocationX", float))
+        events["at_y"].append(get_and_convert(attrib, "LocationY", float))
+        events["to_x"].append(get_and_convert(attrib, "TargetX", float))
+        events["to_y"].append(get_and_convert(attrib, "TargetY", float))
+
+        # qualifier
+        events["qualifier"].append(str(dict(attrib)))
+
+
+def read_event_data_xml(
+    filepath_xml: Union[str, Path, IO[bytes]],
+) -> Tuple[Events, Events, Events, Events, Pitch]:
+    """Parses a StatsPerform .xml file and extracts event data and pitch information.
+
+    This function provides a high-level access to the StatsPerform match events xml file
+    and returns Events objects for both teams and information about the pitch.
+
+    Parameters
+    ----------
+    filepath_xml: str or pathlib.Path or binary file-like object
+        Full path to the xml file containing the event data, or a binary file-like
+        object (e.g. ``io.BytesIO``) providing its content.
+
+    Returns
+    -------
+    data_objects: Tuple[Events, Events, Events, Events, Pitch]
+        Events-objects for both teams and both halves and pitch information. The order
+        is (home_ht1, home_ht2, away_ht1, away_ht2, pitch).
+    """
+    # parse xml file with a target that processes elements on the fly (no tree is built)
+    if isinstance(filepath_xml, (str, Path)):
+        filepath_xml = str(filepath_xml)
+    parser = etree.XMLParser(target=_EventDataXMLTarget())
+    target = etree.parse(filepath_xml, parser)
+    teams = target.teams
+    event_lists = target.event_lists
+
+    # convert float columns to typed arrays (missing or malformed values become NaN)
+    # and derive minute and second of game
+    for team in teams:
+        for segment in event_lists[team]:
+            for col in ["gameclock", "at_x", "at_y", "to_x", "to_y"]:
+                event_lists[team][segment][col] = pd.to_numeric(
+                    event_lists[team][segment][col], errors="coerce"
+                ).astype(float)
+            minute, second = np.divmod(event_lists[team][segment]["gameclock"], 60)
+            event_lists[team][segment]["minute"] = minute
+            event_lists[team][segment]["second"] = np.floor(second)
 
     # create pitch
-    length = get_and_convert(root.attrib, "FieldLength", int) / 100
-    width = get_and_convert(root.attrib, "FieldWidth", int) / 100
+    length = get_and_convert(target.root_attrib, "FieldLength", int) / 100
+    width = get_and_convert(target.root_attrib, "FieldWidth", int) / 100
     pitch = Pitch.from_template(
         "statsperform_event",
         length=length,
@@ -847,7 +847,7 @@ def read_tracking_data_txt(
         identified in StatsPerform files via jID, and this dictionary is used to map
         them to a specific xID in the respective XY objects. Should be supplied if that
         order matters. If None is given (default), the links are automatically extracted
-        from the csv file at the cost of a second pass through the entire file.
+        from the txt file.
 
     Returns
     -------
@@ -855,13 +855,18 @@ def read_tracking_data_txt(
         XY-objects for both teams and both halves. The order is (home_ht1, home_ht2,
         away_ht1, away_ht2, ball_ht1, ball_ht2).
     """
-    # parse txt file for periods and estimate framerate if not contained in filepath
-    periods, framerate_est = _read_time_information_from_tracking_data_txt(filepath_txt)
+    # parse txt file for periods and jIDs and estimate framerate
+    (
+        periods,
+        framerate_est,
+        home_jIDs,
+        away_jIDs,
+    ) = _read_meta_information_from_tracking_data_txt(filepath_txt)
     segments = list(periods.keys())
 
     # create or check links
     if links is None:
-        links = create_links_from_statsperform_tracking_data_txt(filepath_txt)
+        links = _create_links_from_jIDs(home_jIDs, away_jIDs)
     else:
         pass
         # potential check vs jerseys in txt file
@@ -879,54 +884,142 @@ def read_tracking_data_txt(
     xydata = {}
     xydata["Home"] = {
         segment: np.full(
-            [number_of_frames[segment], number_of_home_players * 2], np.nan
+            [number_of_frames[segment], number_of_home_players * 2], np.nan, order="F"
         )
         for segment in segments
     }
     xydata["Away"] = {
         segment: np.full(
-            [number_of_frames[segment], number_of_away_players * 2], np.nan
+            [number_of_frames[segment], number_of_away_players * 2], np.nan, order="F"
         )
         for segment in segments
     }
     xydata["Ball"] = {
-        segment: np.full([number_of_frames[segment], 2], np.nan) for segment in segments
+        segment: np.full([number_of_frames[segment], 2], np.nan, order="F")
+        for segment in segments
     }
 
-    # read txt file from disk
-    with open(filepath_txt, "r") as f:
-        tracking_data_lines = f.readlines()
+    # stream txt file from disk in chunks of lines, each line (frame) split into time,
+    # player and ball chunk
+    for lines in pd.read_csv(
+        filepath_txt,
+        sep="\t",  # not contained in the txt format, so each line is read as a whole
+        header=None,
+        names=["line"],
+        dtype=str,
+        quoting=csv.QUOTE_NONE,
+        chunksize=_TXT_CHUNKSIZE,
+    ):
+        # ball chunk may be missing, any sections after the ball chunk are ignored
+        sections = lines["line"].str.split(":", n=3)
+        lines_df = pd.DataFrame(
+            {
+                "time": sections.str[0],
+                "players": sections.str[1],
+                "ball": sections.str[2].fillna(""),
+            },
+            index=lines.index,
+        )
 
-    # loop
-    for package in tracking_data_lines:
-
-        # read line to get gameclock, player positions and ball info
-        (
-            gameclock,
-            segment,
-            positions,
-            ball,
-        ) = _read_tracking_data_txt_single_line(package)
-
-        # check if frame is in any segment
-        if segment is None:
-            # skip line if not
-            continue
-        else:
-            # otherwise calculate relative frame (in respective segment)
-            frame_rel = int((gameclock - periods[segment][0]) / 1000 * framerate_est)
-
-        # insert (x,y)-data into np.array
-        for team in ["Home", "Away"]:
-            for jID in positions[team].keys():
-                # map jersey number to array index and infer respective columns
-                x_col = (links[team][jID] - 1) * 2
-                y_col = (links[team][jID] - 1) * 2 + 1
-                xydata[team][segment][frame_rel, x_col] = positions[team][jID][0]
-                xydata[team][segment][frame_rel, y_col] = positions[team][jID][1]
-
-        # get ball data
-        xydata["Ball"][segment][frame_rel] = ball.get("position", np.nan)
+        # time chunk
+        # systemclock;gameclock,segment,ballstatus - systemclock and ballstatus not used
+        timeinfo = pd.read_csv(
+            io.StringIO("\n".join(lines_df["time"]).replace(";", ",") + "\n"),
+            header=None,
+            names=range(4),
+            usecols=[1, 2],
+            dtype=np.int64,
+        )
+        gameclock = timeinfo[1].values
+        segment_of_frame = timeinfo[2].values
+
+        # calculate relative frames (in respective segment)
+        frame_rel = np.zeros(len(lines_df), dtype=np.int64)
+        for segment in segments:
+            in_segment = segment_of_frame == segment
+            frame_rel[in_segment] = (
+                (gameclock[in_segment] - periods[segment][0]) / 1000 * framerate_est
+            ).astype(np.int64)
+
+        # player chunks, parsed at once with one row per chunk. Each chunk is terminated
+        # by a "|" field, which ends up in the sixth column of chunks of the form
+        # "team,pID,jID,x,y"
+        number_of_player_chunks = lines_df["players"].str.count(";").values + 1
+        malformed_message = (
+            "Player chunks in StatsPerform's tracking data txt file are expected to "
+            "have the form 'team,pID,jID,x,y'"
+        )
+        try:
+            with warnings.catch_warnings():
+                # surplus fields are truncated here and detected below
+                warnings.simplefilter("ignore", pd.errors.ParserWarning)
+                player_df = pd.read_csv(
+                    io.StringIO(
+                        (";".join(lines_df["players"]) + ";").replace(";", ",|\n")
+                    ),
+                    header=None,
+                    names=["team_id", "pID", "jID", "x", "y", "end"],
+                    usecols=["team_id", "jID", "x", "y", "end"],
+                    dtype={
+                        "team_id": str,
+                        "jID": str,
+                        "x": np.float64,
+                        "y": np.float64,
+                        "end": "category",
+                    },
+                    index_col=False,
+                )
+        except ValueError as error:
+            raise ValueError(f"{malformed_message}!") from error
+        player_frames = np.repeat(np.arange(len(lines_df)), number_of_player_chunks)
+
+        # check for chunks with missing or surplus fields (empty chunks are skipped)
+        is_malformed = (player_df["end"] != "|").values
+        is_malformed[is_malformed] = (
+            player_df["team_id"][is_malformed].fillna("").str.strip() != ""
+        ).values
+        if np.any(is_malformed):
+            line = lines_df.index[player_frames[np.argmax(is_malformed)]] + 1
+            raise ValueError(
+                f"{malformed_message}, found malformed chunk in line {line}!"
+            )
+
+        for team, team_ids in [("Home", ["0", "3"]), ("Away", ["1", "4"])]:
+            is_team = player_df["team_id"].isin(team_ids).values
+            team_df = player_df[is_team]
+            team_frames = player_frames[is_team]
+
+            # map jersey numbers to array index and infer respective columns
+            xIDs = team_df["jID"].map(links[team])
+            if xIDs.isna().any():
+                raise KeyError(
+                    f"Jersey number(s) {set(team_df['jID'][xIDs.isna()])} of team "
+                    f"{team} are missing in links!"
+                )
+            x_cols = (xIDs.values.astype(np.int64) - 1) * 2
+            y_cols = (xIDs.values.astype(np.int64) - 1) * 2 + 1
+            x = team_df["x"].values
+            y = team_df["y"].values
+
+            for segment in segments:
+                in_segment = segment_of_frame[team_frames] == segment
+                rows = frame_rel[team_frames[in_segment]]
+                xydata[team][segment][rows, x_cols[in_segment]] = x[in_segment]
+                xydata[team][segment][rows, y_cols[in_segment]] = y[in_segment]
+
+        # ball chunk
+        ball_chunks = lines_df["ball"].str.split(";", n=1).str[0]
+        ball_chunks[ball_chunks == ""] = "nan,nan,nan"  # no ball information in chunk
+        ball_df = pd.read_csv(
+            io.StringIO("\n".join(ball_chunks) + "\n"),
+            header=None,
+            names=["x", "y", "z"],
+            usecols=["x", "y"],  # z-coordinate is not yet supported
+            dtype=np.float64,
+        )
+        for segment in segments:
+            in_segment = segment_of_frame == segment
+            xydata["Ball"][segment][frame_rel[in_segment]] = ball_df.values[in_segment]
 
     # create XY objects
     home_ht1 = XY(xy=xydata["Home"][1], framerate=framerate_est)
@@ -947,8 +1040,8 @@ def read_event_data_from_url(
     """Reads a URL containing a StatsPerform events csv file and extracts the stored
     event data and pitch information.
 
-    The event data from the URL is downloaded into a temporary file stored in the
-    repository's internal root ``.data``-folder and removed afterwards.
+    The event data from the URL is downloaded into memory and parsed from there, without
+    writing a temporary file to disk.
 
     Parameters
     ----------
@@ -961,14 +1054,7 @@ def read_event_data_from_url(
         Events-objects for both teams and both halves and pitch information. The order
         is (home_ht1, home_ht2, away_ht1, away_ht2, pitch).
     """
-    data_dir = os.path.join(DATA_DIR, "statsperform")
-    if not os.path.isdir(data_dir):
-        os.makedirs(data_dir, exist_ok=True)
-    temp_file = os.path.join(data_dir, "events_temp.xml")
-    with open(temp_file, "wb") as binary_file:
-        binary_file.write(download_from_url(url))
-    data_objects = read_event_data_xml(filepath_xml=os.path.join(data_dir, temp_file))
-    os.remove(os.path.join(data_dir, temp_file))
+    data_objects = read_event_data_xml(filepath_xml=io.BytesIO(download_from_url(url)))
     return data_objects
 
 
@@ -1003,8 +1089,7 @@ def read_tracking_data_from_url(
     if not os.path.isdir(data_dir):
         os.makedirs(data_dir, exist_ok=True)
     temp_file = os.path.join(data_dir, "tracking_temp.txt")
-    with open(temp_file, "wb") as binary_file:
-        binary_file.write(download_from_url(url))
+    download_to_file(url, temp_file)
     data_objects = read_tracking_data_txt(
         filepath_txt=os.path.join(data_dir, temp_file),
         links=links,
@@ -34,6 +34,23 @@ def download_from_url(path: str) -> AnyStr:
     return res.read()
 
 
+def download_to_file(path: str, filepath: str, chunk_size: int = 1 << 20) -> None:
+    """Downloads file from URL and streams it to disk in chunks, without holding the
+    entire response in memory.
+
+    Parameters
+    ----------
+    path : str
+        URL path to download data from
+    filepath : str
+        Path to the file the downloaded data is written to.
+    chunk_size : int, optional
+        Number of bytes that are read and written at once, defaults to 1 MiB.
+    """
+    with urllib.request.urlopen(path) as res, open(filepath, "wb") as binary_file:
+        shutil.copyfileobj(res, binary_file, length=chunk_size)
+
+
 def get_and_convert(dic: dict, key: Any, value_type: type, default: Any = None) -> Any:
     """Performs dictionary get and type conversion simultaneously.
 
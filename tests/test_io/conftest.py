@@ -164,3 +164,127 @@ def eigd_sample_data_floodlight_shape() -> np.ndarray:
     )
 
     return data
+
+
+# StatsPerform event xml mock data with two teamsheets, referees and two halves
+@pytest.fixture()
+def statsperform_event_xml_sections() -> dict:
+    sections = {
+        "head": '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<Match FieldLength="10500" FieldWidth="6800" Id="1">',
+        "matchsheet": "<MatchSheet>"
+        '<Team Type="HomeTeam" Name="H">'
+        '<Actor IdActor="101" Occupation="Player" JerseyNumber="1" NickName="h1"/>'
+        '<Actor IdActor="102" Occupation="Player" JerseyNumber="7" NickName="h7"/>'
+        '<Actor IdActor="150" Occupation="Coach" JerseyNumber="0" NickName="hc"/>'
+        "</Team>"
+        '<Team Type="AwayTeam" Name="A">'
+        '<Actor IdActor="201" Occupation="Player" JerseyNumber="9" NickName="a9"/>'
+        "</Team>"
+        '<Team Type="Referees">'
+        '<Actor IdActor="301" Occupation="Referee" NickName="r"/>'
+        "</Team>"
+        "</MatchSheet>",
+        "events": "<Events>"
+        '<EventsHalf IdHalf="1">'
+        '<Event EventName="Pass" Time="1500" IdActor1="101" LocationX="-100" '
+        'LocationY="200" TargetX="300" TargetY="-400" IdEvent="1"/>'
+        '<Event EventName="Shot" Time="61900" IdActor1="201" LocationX="500" '
+        'LocationY="0" IdEvent="2"/>'
+        '<Event EventName="KickOff" Time="0" IdEvent="3"/>'
+        "</EventsHalf>"
+        '<EventsHalf IdHalf="2">'
+        '<Event EventName="Foul" Time="2700000" IdActor1="102" LocationX="0" '
+        'LocationY="0" IdEvent="4"/>'
+        "</EventsHalf>"
+        "</Events>",
+        "tail": "</Match>",
+    }
+
+    return sections
+
+
+# StatsPerform open tracking csv mock data with two segments (frames 0-3 and 10-12),
+# two home players, one away player and the ball
+@pytest.fixture()
+def statsperform_open_tracking_csv_content() -> str:
+    header = (
+        "team_id,player_id,jersey_no,frame_count,pos_x,pos_y,possession,"
+        "pitch_dimension_long_side,pitch_dimension_short_side"
+    )
+    lines = [header]
+    for frame in [0, 1, 2, 3, 10, 11, 12]:
+        for team_id, pID, jID in [(1.0, 101, 7), (1.0, 102, 17), (2.0, 201, 9)]:
+            x = frame + jID / 100
+            y = -frame - jID / 100
+            lines.append(f"{team_id},{pID},{jID},{frame},{x},{y},,105,68")
+        possession = 1.0 if frame < 10 else 2.0
+        lines.append(f"4,,,{frame},{frame + 0.5},{-frame - 0.5},{possession},105,68")
+
+    return "\n".join(lines) + "\n"
+
+
+# StatsPerform tracking txt mock data with two segments at 25 Hz, containing empty
+# player chunks, a referee chunk and lines without ball chunk
+@pytest.fixture()
+def statsperform_tracking_txt_lines() -> list:
+    lines = [
+        "1600000000000;0,1,0:0,1005,5,1.5,-1.5;3,1001,1,1.1,-1.1;1,1009,9,1.9,-1.9;"
+        "2,1099,99,0.0,0.0;:10.0,20.0,0.5;A;Alive;",
+        "1600000000040;40,1,0:0,1005,5,2.5,-2.5;3,1001,1,2.1,-2.1;1,1009,9,2.9,-2.9;;",
+        "1600000000080;80,1,0:0,1005,5,3.5,-3.5;1,1009,9,3.9,-3.9;"
+        ":30.0,40.0,0.5;A;Alive;",
+        "1600002700000;2700000,2,0:0,1005,5,4.5,-4.5;3,1001,1,4.1,-4.1;"
+        "1,1009,9,4.9,-4.9;:50.0,60.0,0.5;A;Alive;",
+        "1600002700040;2700040,2,0:0,1005,5,5.5,-5.5;3,1001,1,5.1,-5.1;"
+        "1,1009,9,5.9,-5.9;",
+    ]
+
+    return lines
+
+
+# Position data of the StatsPerform tracking txt mock data in floodlight format (for
+# links placing jIDs 1 and 5 of the home team and jID 9 of the away team in order)
+@pytest.fixture()
+def statsperform_tracking_txt_xy() -> dict:
+    nan = np.nan
+    xy = {
+        "home_ht1": np.array(
+            [
+                [1.1, -1.1, 1.5, -1.5, nan, nan],
+                [2.1, -2.1, 2.5, -2.5, nan, nan],
+                [nan, nan, 3.5, -3.5, nan, nan],
+            ]
+        ),
+        "home_ht2": np.array(
+            [[4.1, -4.1, 4.5, -4.5, nan, nan], [5.1, -5.1, 5.5, -5.5, nan, nan]]
+        ),
+        "away_ht1": np.array(
+            [[1.9, -1.9, nan, nan], [2.9, -2.9, nan, nan], [3.9, -3.9, nan, nan]]
+        ),
+        "away_ht2": np.array([[4.9, -4.9, nan, nan], [5.9, -5.9, nan, nan]]),
+        "ball_ht1": np.array([[10.0, 20.0], [nan, nan], [30.0, 40.0]]),
+        "ball_ht2": np.array([[50.0, 60.0], [nan, nan]]),
+    }
+
+    return xy
+
+
+# StatsPerform open event csv mock data with events of both teams, an event without
+# team assignment and two segments
+@pytest.fixture()
+def statsperform_open_event_csv_content() -> str:
+    header = (
+        ",event_id,frame_count,current_phase,gameclock,event_name,event_type_id,"
+        "sequencenumber,player_id,team_id,jersey_no,is_pass,is_cross,is_corner,"
+        "is_free_kick,is_goal_kick,passtypeid,wintypeid,savetypeid,possessionnumber"
+    )
+    lines = [
+        header,
+        "0,1000,100,1,125.7,Pass Won,1,0,108,1.0,17,1,0,0,0,0,3,,,7",
+        "1,1001,103,1,59.99,Duel Lost Aerial,31,1,205,2.0,9,0,0,0,0,0,,2,,8",
+        "2,1002,106,2,2800.0,Out,5,2,,,,0,0,0,0,0,,,,9",
+        "3,1003,109,2,2830.25,Ball Won,49,3,211,2.0,11,0,0,0,0,0,,,,10",
+    ]
+
+    return "\n".join(lines) + "\n"
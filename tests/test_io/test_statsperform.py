@@ -0,0 +1,279 @@
+import numpy as np
+import pytest
+
+from floodlight.io import statsperform
+from floodlight.io.statsperform import (
+    read_event_data_xml,
+    read_open_event_data_csv,
+    read_open_tracking_data_csv,
+    read_tracking_data_txt,
+)
+
+
+# Test read_event_data_xml function for team assignment of events
+@pytest.mark.unit
+def test_read_event_data_xml_team_assignment(
+    tmp_path, statsperform_event_xml_sections
+) -> None:
+    sections = statsperform_event_xml_sections
+    filepath = tmp_path / "events.xml"
+    filepath.write_text(
+        sections["head"]
+        + sections["matchsheet"]
+        + sections["events"]
+        + sections["tail"]
+    )
+
+    home_ht1, home_ht2, away_ht1, away_ht2, pitch = read_event_data_xml(filepath)
+
+    # events without linked actor are assigned to both teams
+    assert home_ht1.events["eID"].tolist() == ["Pass", "KickOff"]
+    assert away_ht1.events["eID"].tolist() == ["Shot", "KickOff"]
+    assert home_ht2.events["eID"].tolist() == ["Foul"]
+    assert len(away_ht2.events) == 0
+    assert home_ht1.events["jID"].tolist()[0] == 1
+    assert home_ht1.events["gameclock"].tolist() == [1.5, 0.0]
+    assert pitch.xlim == (-5250.0, 5250.0)
+
+    # events of repeated halves are kept
+    repeated_half = (
+        '<EventsHalf IdHalf="1">'
+        '<Event EventName="Cross" Time="3000" IdActor1="102" LocationX="0" '
+        'LocationY="0" IdEvent="5"/>'
+        "</EventsHalf>"
+    )
+    filepath_repeated = tmp_path / "events_repeated.xml"
+    filepath_repeated.write_text(
+        sections["head"]
+        + sections["matchsheet"]
+        + sections["events"].replace("</Events>", repeated_half + "</Events>")
+        + sections["tail"]
+    )
+
+    home_ht1, _, away_ht1, _, _ = read_event_data_xml(filepath_repeated)
+
+    assert home_ht1.events["eID"].tolist() == ["Pass", "KickOff", "Cross"]
+    assert away_ht1.events["eID"].tolist() == ["Shot", "KickOff"]
+
+
+# Test read_event_data_xml function with teamsheets following the events
+@pytest.mark.unit
+def test_read_event_data_xml_matchsheet_after_events(
+    tmp_path, statsperform_event_xml_sections
+) -> None:
+    sections = statsperform_event_xml_sections
+    filepath_ordered = tmp_path / "events_ordered.xml"
+    filepath_ordered.write_text(
+        sections["head"]
+        + sections["matchsheet"]
+        + sections["events"]
+        + sections["tail"]
+    )
+    filepath_reversed = tmp_path / "events_reversed.xml"
+    filepath_reversed.write_text(
+        sections["head"]
+        + sections["events"]
+        + sections["matchsheet"]
+        + sections["tail"]
+    )
+
+    data_ordered = read_event_data_xml(filepath_ordered)
+    data_reversed = read_event_data_xml(filepath_reversed)
+
+    for events_ordered, events_reversed in zip(data_ordered[:4], data_reversed[:4]):
+        assert events_ordered.events.equals(events_reversed.events)
+    assert len(data_reversed[0].events) == 2
+
+
+# Test read_event_data_xml function with malformed coordinates
+@pytest.mark.unit
+def test_read_event_data_xml_malformed_coordinates(
+    tmp_path, statsperform_event_xml_sections
+) -> None:
+    sections = statsperform_event_xml_sections
+    events = sections["events"].replace('LocationX="-100"', 'LocationX="n/a"')
+    filepath = tmp_path / "events.xml"
+    filepath.write_text(
+        sections["head"] + sections["matchsheet"] + events + sections["tail"]
+    )
+
+    home_ht1, _, _, _, _ = read_event_data_xml(filepath)
+
+    # malformed values are coerced to NaN
+    assert home_ht1.events["at_x"].dtype == np.float64
+    assert np.isnan(home_ht1.events["at_x"].values[0])
+    assert home_ht1.events["at_y"].values[0] == 200.0
+
+
+# Test read_open_event_data_csv function
+@pytest.mark.unit
+def test_read_open_event_data_csv(
+    tmp_path, statsperform_open_event_csv_content
+) -> None:
+    filepath = tmp_path / "events.csv"
+    filepath.write_text(statsperform_open_event_csv_content)
+
+    t1_ht1, t1_ht2, t2_ht1, t2_ht2 = read_open_event_data_csv(filepath)
+
+    # team and segment assignment, events without team are added to both teams
+    assert t1_ht1.events["eID"].tolist() == ["PassWon"]
+    assert t1_ht2.events["eID"].tolist() == ["Out"]
+    assert t2_ht1.events["eID"].tolist() == ["DuelLostAerial"]
+    assert t2_ht2.events["eID"].tolist() == ["Out", "BallWon"]
+
+    # outcome
+    assert t1_ht1.events["outcome"].tolist() == [1]
+    assert t2_ht1.events["outcome"].tolist() == [0]
+    assert np.isnan(t2_ht2.events["outcome"].values[0])
+    assert t2_ht2.events["outcome"].values[1] == 1
+
+    # minute and second
+    assert t1_ht1.events[["minute", "second"]].values.tolist() == [[2, 5]]
+    assert t2_ht1.events[["minute", "second"]].values.tolist() == [[0, 59]]
+    assert t2_ht2.events[["minute", "second"]].values.tolist() == [[46, 40], [47, 10]]
+
+    # qualifier (without trailing line break of the last value)
+    assert t1_ht1.events["qualifier"].values[0] == {
+        "event_id": "1000",
+        "event_type_id": "1",
+        "sequencenumber": "0",
+        "jersey_no": "17",
+        "is_pass": "1",
+        "is_cross": "0",
+        "is_corner": "0",
+        "is_free_kick": "0",
+        "is_goal_kick": "0",
+        "passtypeid": "3",
+        "wintypeid": "",
+        "savetypeid": "",
+        "possessionnumber": "7",
+    }
+
+
+# Test read_open_event_data_csv function with unknown team ids and segments
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "replaced, replacement",
+    [(",108,1.0,", ",108,3.0,"), ("0,1000,100,1,", "0,1000,100,3,")],
+)
+def test_read_open_event_data_csv_unknown_ids(
+    tmp_path, replaced, replacement, statsperform_open_event_csv_content
+) -> None:
+    filepath = tmp_path / "events.csv"
+    filepath.write_text(
+        statsperform_open_event_csv_content.replace(replaced, replacement)
+    )
+
+    with pytest.raises(KeyError):
+        read_open_event_data_csv(filepath)
+
+
+# Test read_open_tracking_data_csv function with jersey numbers missing in links
+@pytest.mark.unit
+def test_read_open_tracking_data_csv_missing_links(
+    tmp_path, statsperform_open_tracking_csv_content
+) -> None:
+    filepath = tmp_path / "tracking.csv"
+    filepath.write_text(statsperform_open_tracking_csv_content)
+    links = {"Home": {7: 0}, "Away": {9: 0}}  # jersey 17 is missing and larger
+
+    with pytest.raises(KeyError, match="missing in links"):
+        read_open_tracking_data_csv(filepath, links=links)
+
+
+# Test read_open_tracking_data_csv function for ball positions and possession codes
+@pytest.mark.unit
+def test_read_open_tracking_data_csv_ball(
+    tmp_path, statsperform_open_tracking_csv_content
+) -> None:
+    filepath = tmp_path / "tracking.csv"
+    filepath.write_text(statsperform_open_tracking_csv_content)
+
+    data_objects = read_open_tracking_data_csv(filepath)
+    ball_ht1, ball_ht2, possession_ht1, possession_ht2 = data_objects[4:8]
+
+    frames_ht1 = np.array([0, 1, 2, 3])
+    frames_ht2 = np.array([10, 11, 12])
+    assert np.array_equal(
+        ball_ht1.xy, np.stack([frames_ht1 + 0.5, -frames_ht1 - 0.5], axis=1)
+    )
+    assert np.array_equal(
+        ball_ht2.xy, np.stack([frames_ht2 + 0.5, -frames_ht2 - 0.5], axis=1)
+    )
+    assert np.array_equal(possession_ht1.code, np.full(4, 1.0))
+    assert np.array_equal(possession_ht2.code, np.full(3, 2.0))
+
+
+# Test read_open_tracking_data_csv function for parsing the file in chunks of rows
+@pytest.mark.unit
+def test_read_open_tracking_data_csv_chunks(
+    tmp_path, monkeypatch, statsperform_open_tracking_csv_content
+) -> None:
+    filepath = tmp_path / "tracking.csv"
+    filepath.write_text(statsperform_open_tracking_csv_content)
+
+    data_objects = read_open_tracking_data_csv(filepath)
+    monkeypatch.setattr(statsperform, "_OPEN_CSV_CHUNKSIZE", 3)
+    data_objects_chunked = read_open_tracking_data_csv(filepath)
+
+    for xy, xy_chunked in zip(data_objects[:6], data_objects_chunked[:6]):
+        assert np.array_equal(xy.xy, xy_chunked.xy, equal_nan=True)
+    for code, code_chunked in zip(data_objects[6:8], data_objects_chunked[6:8]):
+        assert np.array_equal(code.code, code_chunked.code, equal_nan=True)
+    assert np.sum(~np.isnan(data_objects[0].xy)) == 4 * 2 * 2
+
+
+# Test read_tracking_data_txt function
+@pytest.mark.unit
+@pytest.mark.parametrize("line_ending", ["\n", "\r\n", ":\n", ":\r\n"])
+def test_read_tracking_data_txt(
+    tmp_path,
+    line_ending,
+    statsperform_tracking_txt_lines,
+    statsperform_tracking_txt_xy,
+) -> None:
+    filepath = tmp_path / "tracking.txt"
+    filepath.write_bytes(
+        (line_ending.join(statsperform_tracking_txt_lines) + line_ending).encode()
+    )
+    links = {"Home": {"1": 1, "5": 2}, "Away": {"9": 1}}
+
+    data_objects = read_tracking_data_txt(filepath, links=links)
+
+    names = ["home_ht1", "home_ht2", "away_ht1", "away_ht2", "ball_ht1", "ball_ht2"]
+    for name, xy in zip(names, data_objects):
+        assert xy.framerate == 25
+        assert np.array_equal(xy.xy, statsperform_tracking_txt_xy[name], equal_nan=True)
+
+
+# Test read_tracking_data_txt function for parsing the file in chunks of lines
+@pytest.mark.unit
+def test_read_tracking_data_txt_chunks(
+    tmp_path, monkeypatch, statsperform_tracking_txt_lines
+) -> None:
+    filepath = tmp_path / "tracking.txt"
+    filepath.write_text("\n".join(statsperform_tracking_txt_lines) + "\n")
+
+    data_objects = read_tracking_data_txt(filepath)
+    monkeypatch.setattr(statsperform, "_TXT_CHUNKSIZE", 2)
+    data_objects_chunked = read_tracking_data_txt(filepath)
+
+    for xy, xy_chunked in zip(data_objects, data_objects_chunked):
+        assert np.array_equal(xy.xy, xy_chunked.xy, equal_nan=True)
+
+
+# Test read_tracking_data_txt function with player chunks of wrong length
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "malformed_chunk", ["1,1009,9,2.9,-2.9,7", "1,1009,9,2.9", "1,1009,9"]
+)
+def test_read_tracking_data_txt_malformed_chunks(
+    tmp_path, malformed_chunk, statsperform_tracking_txt_lines
+) -> None:
+    lines = statsperform_tracking_txt_lines
+    lines[1] = lines[1].replace("1,1009,9,2.9,-2.9", malformed_chunk)
+    filepath = tmp_path / "tracking.txt"
+    filepath.write_text("\n".join(lines) + "\n")
+
+    with pytest.raises(ValueError, match="team,pID,jID,x,y"):
+        read_tracking_data_txt(filepath)
@@ -1,6 +1,6 @@
 import pytest
 
-from floodlight.io.utils import get_and_convert
+from floodlight.io.utils import download_to_file, get_and_convert
 
 
 # Test get_and_convert function
@@ -18,3 +18,17 @@ def test_get_and_convert() -> None:
     assert get_and_convert(sample_dict, "foo", dict) == "1"
     # custom default with failed conversion
     assert get_and_convert(sample_dict, "bar", int, "default") == "default"
+
+
+# Test download_to_file function
+@pytest.mark.unit
+def test_download_to_file(tmp_path) -> None:
+    data = bytes(range(256)) * 100
+    source = tmp_path / "source.bin"
+    source.write_bytes(data)
+    target = tmp_path / "target.bin"
+
+    # small chunk size to stream the file in several chunks
+    download_to_file(source.as_uri(), str(target), chunk_size=1000)
+
+    assert target.read_bytes() == data